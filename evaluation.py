@@ -3,172 +3,478 @@ Evaluation script for NLP project (ABSA on Restaurant category)
 '''
 import argparse
 import os
+from functools import lru_cache
 
+# numpy is imported by _load_kernels, only documents above
+# _SCAN_DOC_SIZE spans need it
+np = None
 
-# checking paths of the files
-def check_path_exists(path: str) -> None:
-    '''
-    Check if path to file exists.
-    '''
-    if not os.path.exists(path):
-        raise ValueError('Path is not valid!')
 
-
-def check_file_extension(path: str) -> None:
+# checking paths of the files
+def check_file(path: str) -> None:
     '''
-    Check extension of file.
+    Check if path to file exists and file extension is allowed.
     Raise error if file extension is not in the list
     of the allowed extensions.
     '''
-    if os.path.splitext(path)[1] != '.txt':
+    try:
+        os.stat(path)
+    except OSError:
+        raise ValueError('Path is not valid!') from None
+    if not path.endswith('.txt'):
         raise ValueError(
             f'''Program do not support this file extension!
             Please, use .txt'''
             )
 
 
-def get_gold_info(gold_path: str) -> tuple:
+# files from this size are read with pyarrow when it is installed,
+# smaller ones are parsed faster than pyarrow is imported
+_ARROW_FILE_SIZE = 1 << 23
+
+
+# reading the files
+def count_lines(path: str) -> int:
     '''
-    Get gold aspect categories and size of the gold standard from file.
+    Count lines of the file without decoding it.
+    '''
+    lines, last = 0, b'\n'
+
+    with open(path, 'rb') as f:
+        for buf in iter(lambda: f.read(1 << 20), b''):
+            lines += buf.count(b'\n')
+            last = buf[-1:]
+
+    return lines + (last != b'\n')
+
+
+def read_aspects(path: str, doc_ids: dict, cat_ids: dict, sent_ids: dict,
+                 new_docs: bool = True) -> tuple:
+    '''
+    Read aspects from file into lists of document codes, starts, ends,
+    category codes and sentiment codes.
+    Codes of unseen categories and sentiments are added to cat_ids and
+    sent_ids, codes of unseen documents are added to doc_ids only
+    if new_docs is set.
+    '''
+    # pyarrow is optional, files are parsed line by line without it
+    if os.path.getsize(path) >= _ARROW_FILE_SIZE:
+        try:
+            import pyarrow.csv  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            return _read_aspects_arrow(path, doc_ids, cat_ids, sent_ids,
+                                       new_docs)
+
+    n_lines = count_lines(path)
+    docs, starts, ends = [0] * n_lines, [0] * n_lines, [0] * n_lines
+    cats, sents = [0] * n_lines, [0] * n_lines
+
+    doc_code = doc_ids.setdefault if new_docs else lambda doc, _: doc_ids[doc]
+    cat_code, sent_code = cat_ids.setdefault, sent_ids.setdefault
+
+    # only the last field keeps the line ending, lines with other
+    # than 6 fields are rejected like in the pyarrow reader
+    with open(path, buffering=1 << 20, newline='') as f:
+        for i, line in enumerate(f):
+            doc, cat, _, start, end, sent = line.split('\t')
+            docs[i] = doc_code(doc, len(doc_ids))
+            starts[i] = int(start)
+            ends[i] = int(end)
+            cats[i] = cat_code(cat, len(cat_ids))
+            sents[i] = sent_code(sent.rstrip('\r\n'), len(sent_ids))
+
+    return docs, starts, ends, cats, sents
+
+
+def _encode_column(column, ids: dict, new_ids: bool) -> list:
+    '''
+    Code values of the string column with ids.
+    '''
+    import pyarrow as pa
+
+    encoded = column.combine_chunks().dictionary_encode()
+    values = encoded.dictionary.to_pylist()
+    if new_ids:
+        codes = [ids.setdefault(value, len(ids)) for value in values]
+    else:
+        codes = [ids[value] for value in values]
+
+    return pa.array(codes, type=pa.int32()).take(encoded.indices).to_numpy().tolist()
+
+
+def _read_aspects_arrow(path: str, doc_ids: dict, cat_ids: dict, sent_ids: dict,
+                        new_docs: bool) -> tuple:
+    '''
+    Read aspects from file with the pyarrow CSV reader.
+    Return the same lists as read_aspects.
+    '''
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    table = pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(
+            column_names=['doc', 'cat', 'term', 'start', 'end', 'sent']
+        ),
+        parse_options=pacsv.ParseOptions(
+            delimiter='\t', quote_char=False, ignore_empty_lines=False
+        ),
+        convert_options=pacsv.ConvertOptions(column_types={
+            'doc': pa.string(), 'cat': pa.string(), 'term': pa.string(),
+            'start': pa.int32(), 'end': pa.int32(), 'sent': pa.string()
+        })
+    )
+
+    # empty lines and empty positions are read as nulls,
+    # the line parser fails on them
+    if table.column('start').null_count or table.column('end').null_count:
+        raise ValueError(f'Missing span positions in {path}')
+
+    docs = _encode_column(table.column('doc'), doc_ids, new_docs)
+    starts = table.column('start').to_numpy().tolist()
+    ends = table.column('end').to_numpy().tolist()
+    cats = _encode_column(table.column('cat'), cat_ids, True)
+    sents = _encode_column(table.column('sent'), sent_ids, True)
+
+    return docs, starts, ends, cats, sents
+
+
+def pack_spans(starts: 'np.ndarray', ends: 'np.ndarray') -> 'np.ndarray':
+    '''
+    Pack (start, end) pairs into int64 values: start << 32 | end.
+    '''
+    return (starts.astype(np.int64) << 32) | ends.astype(np.int64)
+
+
+# documents up to this size are scanned span by span
+_SCAN_DOC_SIZE = 32
+
+
+def build_interval_trees(ends, doc_offsets):
+    '''
+    Build augmented interval trees of the documents over spans sorted
+    by start, ends are given in that order.
+    Tree of the document is implicit: the node of the range [a, b) is
+    (a + b) // 2, its children are the nodes of [a, node) and
+    [node + 1, b), maxupper[node] is the maximal end in [a, b).
+    Documents scanned whole by the matcher get no tree.
+    Called as compiled by _load_kernels.
+    '''
+    maxupper = np.empty_like(ends)
+    stack = np.empty(128, dtype=np.int64)
+
+    for d in range(len(doc_offsets) - 1):
+        if doc_offsets[d + 1] - doc_offsets[d] <= _SCAN_DOC_SIZE:
+            continue
+        stack[0], stack[1] = doc_offsets[d], doc_offsets[d + 1]
+        top = 2
+        while top:
+            top -= 2
+            a, b = stack[top], stack[top + 1]
+            if a >= b:
+                continue
+            node = (a + b) // 2
+            maxupper[node] = ends[a:b].max()
+            stack[top], stack[top + 1] = a, node
+            stack[top + 2], stack[top + 3] = node + 1, b
+            top += 4
+
+    return maxupper
+
+
+def _gold_arrays(gold_docs: list) -> dict:
     '''
-    gold_aspect_cats = {}
+    Build arrays of the gold spans for the matching kernel.
+    Spans of the document with code d are in [offsets[d], offsets[d + 1])
+    in the order of the file, by_start orders them by start within every
+    document, maxupper holds their interval trees built with
+    build_interval_trees.
+    '''
+    build_trees, _ = _load_kernels()
+    spans = [span for gold in gold_docs for span in gold["spans"]]
+    starts, ends, cats, sents = (np.array(column, dtype=np.int32) for column in zip(*spans))
+    sizes = [len(gold["spans"]) for gold in gold_docs]
+    offsets = np.concatenate(([0], np.cumsum(sizes)))
+    by_start = np.lexsort((starts, np.repeat(np.arange(len(sizes)), sizes)))
+
+    return {
+        "offsets": offsets,
+        "starts": starts,
+        "ends": ends,
+        "max_ends": np.array([m for gold in gold_docs for m in gold["max_ends"]], dtype=np.int32),
+        "by_start": by_start,
+        "maxupper": build_trees(ends[by_start], offsets),
+        "spans": pack_spans(starts, ends),
+        "cats": cats,
+        "sents": sents,
+    }
 
-    with open(gold_path) as fg:
-        for line in fg:
-            line = line.rstrip('\r\n').split('\t')
-            if line[0] not in gold_aspect_cats:
-                gold_aspect_cats[line[0]] = {"starts":[], "ends":[], "cats":[], "sents":[]}
-            gold_aspect_cats[line[0]]["starts"].append(int(line[3]))
-            gold_aspect_cats[line[0]]["ends"].append(int(line[4]))
-            gold_aspect_cats[line[0]]["cats"].append(line[1])
-            gold_aspect_cats[line[0]]["sents"].append(line[5])
 
-    gold_size = sum([len(gold_aspect_cats[x]["cats"]) for x in gold_aspect_cats])
+def get_gold_info(gold_path: str) -> tuple:
+    '''
+    Get gold aspect categories and size of the gold standard from file.
+    Documents, categories and sentiments are coded with int codes.
+    Spans of the document with code d are stored in docs[d] as
+    (start, end, category, sentiment) tuples in the order of the file,
+    with the index of the spans by start and the maximal end of the spans
+    from every span to the end of the document.
+    If some document has more than _SCAN_DOC_SIZE spans, arrays
+    for the matching kernel are added.
+    '''
+    doc_ids, cat_ids, sent_ids = {}, {}, {}
+    docs, starts, ends, cats, sents = read_aspects(gold_path, doc_ids, cat_ids, sent_ids)
+
+    doc_spans = [[] for _ in doc_ids]
+    for doc, span in zip(docs, zip(starts, ends, cats, sents)):
+        doc_spans[doc].append(span)
+
+    gold_docs = []
+    for spans in doc_spans:
+        starts_index = {}
+        for i, span in enumerate(spans):
+            starts_index.setdefault(span[0], []).append(i)
+
+        max_ends, max_end = [], spans[-1][1]
+        for span in reversed(spans):
+            if span[1] > max_end:
+                max_end = span[1]
+            max_ends.append(max_end)
+        max_ends.reverse()
+
+        gold_docs.append({"spans": spans, "starts_index": starts_index, "max_ends": max_ends})
+
+    gold_aspect_cats = {
+        "doc_ids": doc_ids,
+        "docs": gold_docs,
+        "cat_ids": cat_ids,
+        "sent_ids": sent_ids,
+    }
+    if any(len(spans) > _SCAN_DOC_SIZE for spans in doc_spans):
+        gold_aspect_cats["arrays"] = _gold_arrays(gold_docs)
+    gold_size = len(docs)
 
     return gold_aspect_cats, gold_size
 
 
-def compute_match(pred_path: str, gold_aspect_cats: dict) -> tuple:
+def _match_kernel(pred_starts, pred_ends, pred_spans, pred_docs,
+                  gold_starts, gold_ends, gold_max_ends, gold_spans,
+                  gold_by_start, gold_maxupper, doc_offsets):
     '''
-    Compute match between predicted and gold aspects.
+    Match predicted spans with gold spans of their documents.
+    Every prediction is matched on its own. Small documents are scanned
+    whole; in larger ones the interval tree
+    (gold_by_start, gold_maxupper) gives the gold spans intersecting
+    the prediction, which are checked in the gold order.
+    Spans are also given packed with pack_spans, gold_max_ends holds
+    the maximal end of the gold spans from every span to the end
+    of its document.
+    Return index of the fully matched gold span for every prediction
+    (-1 if there is none) and (prediction, gold span) index pairs
+    of the partial matches.
+    Called as compiled by _load_kernels.
+    '''
+    n_pred = len(pred_starts)
+    full_idx = np.full(n_pred, -1, dtype=np.int64)
+
+    max_doc_size = 0
+    for p in range(n_pred):
+        max_doc_size = max(max_doc_size, doc_offsets[pred_docs[p] + 1] - doc_offsets[pred_docs[p]])
+    candidates = np.empty(max_doc_size, dtype=np.int64)
+    stack = np.empty(128, dtype=np.int64)
+    # grown by doubling, sized by the number of matches
+    partial_idx = np.empty((max(n_pred, 1), 2), dtype=np.int64)
+    n_partial = 0
+
+    for p in range(n_pred):
+        start, end, span = pred_starts[p], pred_ends[p], pred_spans[p]
+        lo, hi = doc_offsets[pred_docs[p]], doc_offsets[pred_docs[p] + 1]
+
+        n_candidates = 0
+        if hi - lo <= _SCAN_DOC_SIZE:
+            for g in range(lo, hi):
+                candidates[n_candidates] = g
+                n_candidates += 1
+        else:
+            stack[0], stack[1] = lo, hi
+            top = 2
+            while top:
+                top -= 2
+                a, b = stack[top], stack[top + 1]
+                if a >= b:
+                    continue
+                node = (a + b) // 2
+                # all spans of the subtree end before or start after the prediction
+                if gold_maxupper[node] < start or gold_starts[gold_by_start[a]] > end:
+                    continue
+                g = gold_by_start[node]
+                if gold_starts[g] <= end and start <= gold_ends[g]:
+                    # insertion keeps the candidates in the gold order
+                    k = n_candidates
+                    while k > 0 and candidates[k - 1] > g:
+                        candidates[k] = candidates[k - 1]
+                        k -= 1
+                    candidates[k] = g
+                    n_candidates += 1
+                stack[top], stack[top + 1] = a, node
+                stack[top + 2], stack[top + 3] = node + 1, b
+                top += 4
+
+        for k in range(n_candidates):
+            if gold_spans[candidates[k]] == span:
+                full_idx[p] = candidates[k]
+                break
+        if full_idx[p] >= 0:
+            continue
+
+        for k in range(n_candidates):
+            g = candidates[k]
+            s_pos, e_pos = gold_starts[g], gold_ends[g]
+            # gold span inside the prediction and ending with it,
+            # such matches do not stop the search
+            inside = (start <= s_pos) & (e_pos == end)
+            # prediction ends inside the gold span or starts inside it
+            crossing = (
+                (start <= s_pos) & (e_pos != end) & (s_pos <= end) & (end <= gold_max_ends[g])
+                | (start > s_pos) & (start < e_pos) & (e_pos <= end)
+            )
+            if inside | crossing:
+                if n_partial == len(partial_idx):
+                    grown = np.empty((2 * n_partial, 2), dtype=np.int64)
+                    grown[:n_partial] = partial_idx
+                    partial_idx = grown
+                partial_idx[n_partial, 0] = p
+                partial_idx[n_partial, 1] = g
+                n_partial += 1
+                if crossing:
+                    break
+
+    return full_idx, partial_idx[:n_partial]
+
+
+@lru_cache(maxsize=None)
+def _load_kernels() -> tuple:
     '''
+    Import numpy and return build_interval_trees and _match_kernel,
+    compiled with numba if it is installed.
+    '''
+    global np
+    import numpy as np
+
+    try:
+        from numba import njit
+    except ImportError:
+        # numba is optional, kernels run as plain Python without it
+        return build_interval_trees, _match_kernel
+
+    return njit(cache=True)(build_interval_trees), njit(cache=True)(_match_kernel)
+
 
+def _match_lists(preds: tuple, gold_docs: list) -> tuple:
+    '''
+    Match predicted spans with the gold spans of their documents
+    span by span.
+    Return counts of full and partial matches and of their category
+    and sentiment matches.
+    '''
     full_match, partial_match, full_cat_match, partial_cat_match = 0, 0, 0, 0
-    total = 0
-    fully_matched_pairs = []
-    partially_matched_pairs = []
-
-    with open(pred_path) as fp:
-        for line in fp:
-            total += 1
-            line = line.rstrip('\r\n').split('\t')
-            start, end = int(line[3]), int(line[4])
-            category = line[1]
-            doc_gold_aspect_cats = gold_aspect_cats[line[0]]
-            if start in doc_gold_aspect_cats["starts"]:
-                i = doc_gold_aspect_cats["starts"].index(start)
-                if doc_gold_aspect_cats["ends"][i] == end:
-                    full_match += 1
-                    if doc_gold_aspect_cats["cats"][i] == category:
-                        full_cat_match += 1
-                    else:
-                        partial_cat_match += 1
-                    fully_matched_pairs.append(
-                        (
-                            [
-                                doc_gold_aspect_cats["starts"][i], 
-                                doc_gold_aspect_cats["ends"][i], 
-                                doc_gold_aspect_cats["cats"][i],
-                                doc_gold_aspect_cats["sents"][i]
-                            ],
-                            line
-                        )
-                    )
-                    continue
-            for s_pos in doc_gold_aspect_cats["starts"]:
-                if start <= s_pos:
-                    i = doc_gold_aspect_cats["starts"].index(s_pos)
-                    if doc_gold_aspect_cats["ends"][i] == end:
-                        partial_match += 1
-                        partially_matched_pairs.append(
-                            (
-                                [
-                                    doc_gold_aspect_cats["starts"][i], 
-                                    doc_gold_aspect_cats["ends"][i], 
-                                    doc_gold_aspect_cats["cats"][i],
-                                    doc_gold_aspect_cats["sents"][i]
-                                ],
-                                line
-                            )
-                        )
-                        if doc_gold_aspect_cats["cats"][i] == category:
-                            partial_cat_match += 1
-                        continue
-                    matched = False
-                    for e_pos in doc_gold_aspect_cats["ends"][i:]:
-                        if s_pos <= end <= e_pos:
-                            partial_match += 1
-                            partially_matched_pairs.append(
-                                (
-                                    [
-                                        doc_gold_aspect_cats["starts"][i], 
-                                        doc_gold_aspect_cats["ends"][i], 
-                                        doc_gold_aspect_cats["cats"][i],
-                                        doc_gold_aspect_cats["sents"][i]
-                                    ],
-                                    line
-                                )
-                            )
-                            if doc_gold_aspect_cats["cats"][i] == category:
-                                partial_cat_match += 1
-                            matched = True
-                            break
-                    if matched:
-                        break
-                if start > s_pos:
-                    i = doc_gold_aspect_cats["starts"].index(s_pos)
-                    if start < doc_gold_aspect_cats["ends"][i] <= end:
-                        partial_match += 1
-                        partially_matched_pairs.append(
-                            (
-                                [
-                                    doc_gold_aspect_cats["starts"][i], 
-                                    doc_gold_aspect_cats["ends"][i], 
-                                    doc_gold_aspect_cats["cats"][i],
-                                    doc_gold_aspect_cats["sents"][i]
-                                ],
-                                line
-                            )
-                        )
-                        if doc_gold_aspect_cats["cats"][i] == category:
-                            partial_cat_match += 1
+    full_sent_match, part_sent_match = 0, 0
+
+    for doc, start, end, category, sentiment in zip(*preds):
+        gold = gold_docs[doc]
+        spans = gold["spans"]
+
+        # the first gold span with the same boundaries is the full match
+        for i in gold["starts_index"].get(start, ()):
+            _, e_pos, gold_cat, gold_sent = spans[i]
+            if e_pos == end:
+                full_match += 1
+                if gold_cat == category:
+                    full_cat_match += 1
+                else:
+                    partial_cat_match += 1
+                full_sent_match += gold_sent == sentiment
+                break
+        else:
+            for (s_pos, e_pos, gold_cat, gold_sent), max_end in zip(spans, gold["max_ends"]):
+                # gold span inside the prediction and ending with it,
+                # such matches do not stop the search
+                inside = start <= s_pos and e_pos == end
+                # prediction ends inside the gold span or starts inside it
+                crossing = (
+                    start <= s_pos and e_pos != end and s_pos <= end <= max_end
+                    or s_pos < start < e_pos <= end
+                )
+                if inside or crossing:
+                    partial_match += 1
+                    partial_cat_match += gold_cat == category
+                    part_sent_match += gold_sent == sentiment
+                    if crossing:
                         break
 
-    return full_match, partial_match, full_cat_match, partial_cat_match, fully_matched_pairs, partially_matched_pairs, total
+    return full_match, partial_match, full_cat_match, partial_cat_match, full_sent_match, part_sent_match
 
 
-def compute_sentiment_accuracy(matches: list) -> float:
+def _match_arrays(preds: tuple, gold_arrays: dict) -> tuple:
+    '''
+    Match predicted spans with the gold spans with the matching kernel.
+    Return the same counts as _match_lists.
     '''
-    Compute sentiment accuracy on the matches.
+    _, match_kernel = _load_kernels()
+    pred_docs, pred_starts, pred_ends, pred_cats, pred_sents = (
+        np.array(column, dtype=np.int32) for column in preds
+    )
+    gold_cats, gold_sents = gold_arrays["cats"], gold_arrays["sents"]
+    full_idx, partial_idx = match_kernel(
+        pred_starts, pred_ends, pack_spans(pred_starts, pred_ends), pred_docs,
+        gold_arrays["starts"], gold_arrays["ends"], gold_arrays["max_ends"], gold_arrays["spans"],
+        gold_arrays["by_start"], gold_arrays["maxupper"], gold_arrays["offsets"]
+    )
+
+    fully_matched = np.flatnonzero(full_idx >= 0)
+    full_gold = full_idx[fully_matched]
+    partial_pred, partial_gold = partial_idx[:, 0], partial_idx[:, 1]
+
+    full_match, partial_match = len(fully_matched), len(partial_idx)
+    full_cat_match = int(np.count_nonzero(gold_cats[full_gold] == pred_cats[fully_matched]))
+    partial_cat_match = (
+        full_match - full_cat_match
+        + int(np.count_nonzero(gold_cats[partial_gold] == pred_cats[partial_pred]))
+    )
+
+    full_sent_match = int(np.count_nonzero(gold_sents[full_gold] == pred_sents[fully_matched]))
+    part_sent_match = int(np.count_nonzero(gold_sents[partial_gold] == pred_sents[partial_pred]))
+
+    return full_match, partial_match, full_cat_match, partial_cat_match, full_sent_match, part_sent_match
+
+
+def compute_match(pred_path: str, gold_aspect_cats: dict) -> tuple:
+    '''
+    Compute match between predicted and gold aspects.
+    Documents up to _SCAN_DOC_SIZE spans are matched span by span,
+    larger ones need the interval trees of the matching kernel.
     '''
-    matched_sentiment = 0.
+    # labels missing in the gold standard get new codes
+    cat_ids, sent_ids = dict(gold_aspect_cats["cat_ids"]), dict(gold_aspect_cats["sent_ids"])
+    preds = read_aspects(pred_path, gold_aspect_cats["doc_ids"], cat_ids, sent_ids, new_docs=False)
 
-    for pair in matches:
-        *_, gold_s = pair[0]
-        *_, pred_s = pair[1]
-        if gold_s == pred_s:
-            matched_sentiment += 1
+    if "arrays" in gold_aspect_cats:
+        matches = _match_arrays(preds, gold_aspect_cats["arrays"])
+    else:
+        matches = _match_lists(preds, gold_aspect_cats["docs"])
 
-    return matched_sentiment
+    return (*matches, len(preds[0]))
 
 
 def compute_overall_sentiment_accuracy(gold_cats_path: str, pred_cats_path: str) :
     '''
     Compute overall sentiment accuracy.
     '''
-    with open(gold_cats_path) as gc, open(pred_cats_path) as pc:
-        gold_labels = set(gc.readlines())
-        pred_labels = set(pc.readlines())
+    with open(gold_cats_path, buffering=1 << 20) as gc, open(pred_cats_path, buffering=1 << 20) as pc:
+        # hashes of the lines are enough to compare the labels
+        gold_labels = {hash(line) for line in gc}
+        pred_labels = {hash(line) for line in pc}
 
     return len(gold_labels & pred_labels) / len(gold_labels)
 
@@ -194,15 +500,11 @@ def main() -> None:
     if args.acatsent:
         gold_path, pred_path = args.acatsent
 
-        check_path_exists(gold_path)
-        check_file_extension(gold_path)
-        check_path_exists(pred_path)
-        check_file_extension(pred_path)
+        check_file(gold_path)
+        check_file(pred_path)
 
         gold_aspect_cats, gold_size = get_gold_info(gold_path)
-        full_match, part_match, full_cat_match, part_cat_match, full_matches, part_matches, total = compute_match(pred_path, gold_aspect_cats)
-        full_sent_match = compute_sentiment_accuracy(full_matches)
-        part_sent_match = compute_sentiment_accuracy(part_matches)
+        full_match, part_match, full_cat_match, part_cat_match, full_sent_match, part_sent_match, total = compute_match(pred_path, gold_aspect_cats)
 
         print(f"""
             Full match precision: {full_match / total}
@@ -213,17 +515,15 @@ def main() -> None:
             Full category accuracy: {full_cat_match / total}
             Partial category accuracy: {(full_cat_match + part_cat_match) / total}
 
-            Full sentiment accuracy: {full_sent_match / len(full_matches)}
-            Partial sentiment accuracy: {part_sent_match / len(part_matches)}
+            Full sentiment accuracy: {full_sent_match / full_match}
+            Partial sentiment accuracy: {part_sent_match / part_match}
             """)
 
     if args.rcatsent:
         gold_path, pred_path = args.rcatsent
 
-        check_path_exists(gold_path)
-        check_file_extension(gold_path)
-        check_path_exists(pred_path)
-        check_file_extension(pred_path)
+        check_file(gold_path)
+        check_file(pred_path)
 
         overall_sentiment_accuracy = compute_overall_sentiment_accuracy(gold_path, pred_path)
         print(f'Overall sentiment accuracy: {overall_sentiment_accuracy}')
@@ -0,0 +1,118 @@
+'''
+Regression tests for matching of the aspects in evaluation.py
+'''
+import os
+import random
+import tempfile
+import unittest
+
+import evaluation
+
+
+def reference_match(gold_lines: list, pred_lines: list) -> tuple:
+    '''
+    Count matches with the original matching rules, span by span.
+    Return the same counts as evaluation.compute_match.
+    '''
+    gold = {}
+    for doc, cat, _, start, end, sent in gold_lines:
+        gold.setdefault(doc, []).append((int(start), int(end), cat, sent))
+
+    full_match, partial_match, full_cat_match, partial_cat_match = 0, 0, 0, 0
+    full_sent_match, part_sent_match = 0, 0
+
+    for doc, category, _, start, end, sentiment in pred_lines:
+        start, end = int(start), int(end)
+        spans = gold[doc]
+
+        full = [span for span in spans if span[:2] == (start, end)]
+        if full:
+            full_match += 1
+            if full[0][2] == category:
+                full_cat_match += 1
+            else:
+                partial_cat_match += 1
+            full_sent_match += full[0][3] == sentiment
+            continue
+
+        for i, (s_pos, e_pos, cat, sent) in enumerate(spans):
+            inside = start <= s_pos and e_pos == end
+            crossing = (
+                start <= s_pos and not inside
+                and any(s_pos <= end <= later[1] for later in spans[i:])
+                or start > s_pos and start < e_pos <= end
+            )
+            if inside or crossing:
+                partial_match += 1
+                partial_cat_match += cat == category
+                part_sent_match += sent == sentiment
+            if crossing:
+                break
+
+    return (full_match, partial_match, full_cat_match, partial_cat_match,
+            full_sent_match, part_sent_match, len(pred_lines))
+
+
+def random_lines(rng: random.Random, docs: list, n_lines: int,
+                 max_pos: int) -> list:
+    '''
+    Generate aspect lines with positions up to max_pos.
+    Small max_pos gives many spans with the same start.
+    '''
+    lines = []
+    for _ in range(n_lines):
+        start = rng.randrange(max_pos)
+        end = start + rng.randrange(1, 6)
+        lines.append((
+            rng.choice(docs), rng.choice(['food', 'service', 'price']), 'term',
+            str(start), str(end), rng.choice(['positive', 'negative'])
+        ))
+    return lines
+
+
+class TestComputeMatch(unittest.TestCase):
+    '''
+    Compare compute_match with the original matching rules.
+    '''
+
+    def check_cases(self, n_docs: int, n_gold: int, max_pos: int) -> None:
+        rng = random.Random(n_docs * 1000 + n_gold)
+        docs = [f'doc{i}' for i in range(n_docs)]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            gold_path = os.path.join(tmp, 'gold.txt')
+            pred_path = os.path.join(tmp, 'pred.txt')
+
+            for case in range(20):
+                gold_lines = random_lines(rng, docs, n_gold, max_pos)
+                # predictions only for the documents of the gold standard
+                gold_docs = sorted({line[0] for line in gold_lines})
+                pred_lines = random_lines(rng, gold_docs, n_gold, max_pos)
+                # some predictions repeat the gold spans exactly
+                pred_lines += rng.sample(gold_lines, n_gold // 4)
+
+                for path, lines in ((gold_path, gold_lines), (pred_path, pred_lines)):
+                    with open(path, 'w') as f:
+                        f.writelines('\t'.join(line) + '\n' for line in lines)
+
+                gold_aspect_cats, _ = evaluation.get_gold_info(gold_path)
+                with self.subTest(case=case):
+                    self.assertEqual(
+                        evaluation.compute_match(pred_path, gold_aspect_cats),
+                        reference_match(gold_lines, pred_lines)
+                    )
+
+    def test_small_documents(self):
+        self.check_cases(n_docs=20, n_gold=60, max_pos=40)
+
+    def test_duplicate_starts(self):
+        self.check_cases(n_docs=3, n_gold=40, max_pos=6)
+
+    def test_large_documents(self):
+        n_gold = 4 * evaluation._SCAN_DOC_SIZE
+        self.check_cases(n_docs=1, n_gold=n_gold, max_pos=n_gold)
+        self.check_cases(n_docs=2, n_gold=n_gold, max_pos=8)
+
+
+if __name__ == '__main__':
+    unittest.main()